@@ -1,8 +1,14 @@
 from __future__ import annotations
 
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, TypeVar
 from uuid import uuid4
 
+T = TypeVar("T")
+
+
+class TreeNotFoundError(LookupError):
+    """Raised by TreeRepository.mutate when the requested tree does not exist."""
+
 
 class TreeRepository:
     """In-memory repository for taxonomy structures. Each taxonomy is a dict following CALIBRATION_FREE_SCHEMA.
@@ -14,22 +20,80 @@ class TreeRepository:
 
     def __init__(self) -> None:
         self._trees: Dict[str, Dict[str, Any]] = {}
+        self._revisions: Dict[str, int] = {}
+        self._revision = 0
+        self._delete_listeners: List[Callable[[str], None]] = []
 
     def new_id(self) -> str:
         return uuid4().hex
 
+    def _touch(self, tree_id: str) -> None:
+        self._revision += 1
+        self._revisions[tree_id] = self._revision
+
     def upsert(self, tree_id: str, tree: Dict[str, Any]) -> None:
         self._trees[tree_id] = tree
+        self._touch(tree_id)
+
+    def upsert_many(self, trees: Iterable[Tuple[str, Dict[str, Any]]]) -> None:
+        """Store several (tree_id, tree) pairs; a persistent backend issues one bulk write."""
+        for tree_id, tree in trees:
+            self.upsert(tree_id, tree)
 
     def create(self, tree: Optional[Dict[str, Any]] = None) -> str:
         tree_id = self.new_id()
-        self._trees[tree_id] = tree or {}
+        self._trees[tree_id] = tree if tree is not None else {}
+        self._touch(tree_id)
         return tree_id
 
     def get(self, tree_id: str) -> Optional[Dict[str, Any]]:
         return self._trees.get(tree_id)
 
+    def get_subtree(self, tree_id: str, parts: Sequence[str]) -> Optional[Any]:
+        """Return the value at parts inside a tree, or None if it is missing.
+
+        Raises TreeNotFoundError if the tree itself does not exist. A persistent
+        backend answers this with a projection instead of loading the whole tree.
+        """
+        current: Any = self._trees.get(tree_id)
+        if current is None:
+            raise TreeNotFoundError(tree_id)
+        try:
+            for part in parts:
+                current = current[part]
+        except (KeyError, TypeError):
+            return None
+        return current
+
+    def revision(self, tree_id: str) -> int:
+        """Return a number that changes every time the tree is written (0 if unknown)."""
+        return self._revisions.get(tree_id, 0)
+
+    def mutate(self, tree_id: str, fn: Callable[[Dict[str, Any]], T]) -> T:
+        """Load a tree, apply fn to it and store it back as one operation.
+
+        fn receives the stored tree, edits it in place and returns a result that
+        is passed through. A persistent backend implements this as a single
+        read-modify-write transaction.
+        """
+        tree = self._trees.get(tree_id)
+        if tree is None:
+            raise TreeNotFoundError(tree_id)
+        try:
+            return fn(tree)
+        finally:
+            # fn may have edited the tree before failing, so always count a write
+            self._trees[tree_id] = tree
+            self._touch(tree_id)
+
+    def add_delete_listener(self, listener: Callable[[str], None]) -> None:
+        """Register a callback run with the tree_id of every deleted tree (e.g. to drop caches)."""
+        self._delete_listeners.append(listener)
+
     def delete(self, tree_id: str) -> bool:
+        self._revisions.pop(tree_id, None)
+        for listener in self._delete_listeners:
+            listener(tree_id)
         return self._trees.pop(tree_id, None) is not None
 
     def exists(self, tree_id: str) -> bool:
@@ -49,8 +113,13 @@ class MongoTreeRepository:
 
     # Define the same methods as TreeRepository in the future
     # def upsert(...): ...
+    # def upsert_many(...): ...
     # def create(...): ...
     # def get(...): ...
+    # def get_subtree(...): ...
+    # def revision(...): ...
+    # def mutate(...): ...
+    # def add_delete_listener(...): ...
     # def delete(...): ...
     # def exists(...): ...
 
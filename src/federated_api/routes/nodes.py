@@ -38,6 +38,35 @@ async def add_method(
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 
+@router.post("/{tree_id}/methods/batch")
+async def add_methods(
+    tree_id: str, 
+    payload: Dict[str, Any]
+) -> dict:
+    """Add several optimization methods to the same path and category/subcategory."""
+    try:
+        path = payload.get("path")
+        category = payload.get("category")
+        subcategory = payload.get("subcategory")
+        methods = payload.get("methods")
+        
+        if not path:
+            raise ValueError("'path' is required (e.g., 'model_family/subcategory/specific_model')")
+        if not category:
+            raise ValueError("'category' is required (e.g., 'quantization', 'fusion', 'pruning', 'structural')")
+        if not subcategory:
+            raise ValueError("'subcategory' is required (e.g., 'weight_only', 'layer_fusion', etc.)")
+        if not isinstance(methods, list) or not methods:
+            raise ValueError("'methods' must be a non-empty list of method objects")
+        
+        tree_service.add_optimization_methods(tree_id, path, category, subcategory, methods)
+        return {"status": "added", "count": len(methods)}
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
 @router.put("/{tree_id}/methods/{path:path}/{category}/{subcategory}/{method_index:int}")
 async def update_method(
     tree_id: str, 
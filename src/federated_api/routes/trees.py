@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from typing import Any, Dict
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 
 from federated_api.auth import require_api_key
 from federated_api.database import tree_repository
@@ -13,7 +14,7 @@ from federated_api.models import (
     OptimizationTaxonomy,
 )
 from federated_api.services.tree_service import TreeService
-from federated_api.services.validation_service import ValidationService
+from federated_api.services.validation_service import default_validation_service
 from federated_api.services.conversion_service import ConversionService
 
 # We expose a combined router that includes both public and protected sub-routers
@@ -22,7 +23,7 @@ authed = APIRouter(prefix="/api/v1/trees", tags=["trees"], dependencies=[Depends
 public = APIRouter(prefix="/api/v1/trees", tags=["trees"])
 
 service = TreeService()
-validation_service = ValidationService()
+validation_service = default_validation_service
 conversion_service = ConversionService()
 
 
@@ -74,7 +75,8 @@ async def update_tree_from_file(tree_id: str) -> Dict[str, Any]:
         if not file_path:
             raise FileNotFoundError("Neither base_tree_v2.json nor base_tree.json found in backups/")
         
-        result = service.load_from_file(tree_id, file_path)
+        # Parsing, migration and validation are blocking; keep them off the event loop
+        result = await run_in_threadpool(service.load_from_file, tree_id, file_path)
         return result
     except FileNotFoundError as e:
         raise HTTPException(
@@ -1,8 +1,16 @@
 from __future__ import annotations
 
 import re
+import sys
 import warnings
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Shared default values written into many migrated dicts
+_UNKNOWN = sys.intern('Unknown')
+_UNKNOWN_METHOD = sys.intern('unknown')
+_MEDIUM = sys.intern('medium')
+_MINIMAL = sys.intern('minimal')
 
 # Technique mapping table with explicit mappings, patterns, and fallback logic
 TECHNIQUE_MAPPING: Dict[str, List[str]] = {
@@ -122,6 +130,57 @@ TECHNIQUE_MAPPING: Dict[str, List[str]] = {
     "Stage Pruning": ["prune_magnitude", "structured"],
 }
 
+# Lowercased (pattern, techniques) pairs for the substring pass, in mapping order
+_LOWERED_MAPPING = tuple((pattern.lower(), techniques) for pattern, techniques in TECHNIQUE_MAPPING.items())
+
+
+# Keyword groups for the fallback inference in extract_techniques_from_method_name.
+# Keywords match as substrings of the lowercased method name.
+_FUSION_KEYWORDS = frozenset(('fuse', 'fusion', 'merge', 'combine'))
+_QUANTIZATION_KEYWORDS = frozenset(('quant', 'int8', 'int4', 'bit', 'precision'))
+_QUANTIZATION_DETAIL_KEYWORDS = frozenset(('weight', 'w', 'channel', 'per-channel', 'attention'))
+_PRUNING_KEYWORDS = frozenset(('prune', 'sparse', 'remove', 'drop'))
+_STRUCTURED_PRUNING_KEYWORDS = frozenset(('channel', 'filter', 'structured', 'block'))
+_SKIP_CONNECTION_KEYWORDS = frozenset(('skip', 'connection', 'tailor'))
+_NMS_KEYWORDS = frozenset(('nms', 'non-maximum', 'suppression'))
+_TOPOLOGY_KEYWORDS = frozenset(('topology', 'structure', 'bottleneck', 'restructure'))
+_DECOMPOSITION_KEYWORDS = frozenset(('decompose', 'svd', 'factorization'))
+_TOKEN_MERGING_KEYWORDS = frozenset(('token', 'merge', 'merging'))
+
+_ALL_KEYWORDS = frozenset().union(
+    _FUSION_KEYWORDS,
+    _QUANTIZATION_KEYWORDS,
+    _QUANTIZATION_DETAIL_KEYWORDS,
+    _PRUNING_KEYWORDS,
+    _STRUCTURED_PRUNING_KEYWORDS,
+    _SKIP_CONNECTION_KEYWORDS,
+    _NMS_KEYWORDS,
+    _TOPOLOGY_KEYWORDS,
+    _DECOMPOSITION_KEYWORDS,
+    _TOKEN_MERGING_KEYWORDS,
+)
+
+# Zero-width lookahead tries every position of the name (longest keyword first),
+# so a single scan reports every keyword occurrence, including overlapping ones
+_KEYWORD_RE = re.compile(
+    '(?=(' + '|'.join(re.escape(kw) for kw in sorted(_ALL_KEYWORDS, key=len, reverse=True)) + '))'
+)
+
+# Reverse index: matched keyword -> all keywords it starts with (e.g. 'structured'
+# also implies 'structure'), since only the longest one is reported per position
+_KEYWORD_PREFIXES: Dict[str, frozenset] = {
+    kw: frozenset(other for other in _ALL_KEYWORDS if kw.startswith(other))
+    for kw in _ALL_KEYWORDS
+}
+
+
+def _find_keywords(text: str) -> set:
+    """Return the set of fallback keywords occurring anywhere in text."""
+    found = set()
+    for match in _KEYWORD_RE.finditer(text):
+        found.update(_KEYWORD_PREFIXES[match.group(1)])
+    return found
+
 
 def extract_techniques_from_method_name(method_name: str) -> List[str]:
     """Extract techniques using mapping table with pattern fallback.
@@ -135,55 +194,64 @@ def extract_techniques_from_method_name(method_name: str) -> List[str]:
     if not method_name or not isinstance(method_name, str):
         return []
     
+    # Fresh list per call so callers can mutate it without touching the cache
+    return list(_extract_techniques(method_name))
+
+
+@lru_cache(maxsize=4096)
+def _extract_techniques(method_name: str) -> Tuple[str, ...]:
+    """Cached body of extract_techniques_from_method_name.
+    
+    Method names repeat across models and across re-migration, so each
+    distinct name is only resolved once.
+    """
     # Try exact match first
     if method_name in TECHNIQUE_MAPPING:
-        return TECHNIQUE_MAPPING[method_name].copy()
+        return tuple(TECHNIQUE_MAPPING[method_name])
     
-    # Try pattern matching (regex)
+    # Try pattern matching (substring either way, first mapping entry wins)
     method_lower = method_name.lower()
-    for pattern, techniques in TECHNIQUE_MAPPING.items():
-        # Simple substring matching for now (can be enhanced with regex)
-        pattern_lower = pattern.lower()
+    for pattern_lower, techniques in _LOWERED_MAPPING:
         if pattern_lower in method_lower or method_lower in pattern_lower:
-            return techniques.copy()
+            return tuple(techniques)
     
     # Fallback: infer from keywords
     techniques = []
-    method_lower = method_name.lower()
+    found = _find_keywords(method_lower)
     
     # Fusion keywords
-    if any(kw in method_lower for kw in ['fuse', 'fusion', 'merge', 'combine']):
+    if not found.isdisjoint(_FUSION_KEYWORDS):
         techniques.append('fuse_layers')
     
     # Quantization keywords
-    if any(kw in method_lower for kw in ['quant', 'int8', 'int4', 'bit', 'precision']):
+    if not found.isdisjoint(_QUANTIZATION_KEYWORDS):
         techniques.append('quantize_int8')
-        if 'weight' in method_lower or 'w' in method_lower:
+        if 'weight' in found or 'w' in found:
             techniques.append('weight_only')
-        if 'channel' in method_lower or 'per-channel' in method_lower:
+        if 'channel' in found or 'per-channel' in found:
             techniques.append('per_channel')
-        if 'attention' in method_lower:
+        if 'attention' in found:
             techniques.append('attention_aware')
     
     # Pruning keywords
-    if any(kw in method_lower for kw in ['prune', 'sparse', 'remove', 'drop']):
+    if not found.isdisjoint(_PRUNING_KEYWORDS):
         techniques.append('prune_magnitude')
-        if any(kw in method_lower for kw in ['channel', 'filter', 'structured', 'block']):
+        if not found.isdisjoint(_STRUCTURED_PRUNING_KEYWORDS):
             techniques.append('structured')
     
     # Structural optimization keywords
-    if any(kw in method_lower for kw in ['skip', 'connection', 'tailor']):
+    if not found.isdisjoint(_SKIP_CONNECTION_KEYWORDS):
         techniques.append('skip_connection_optimization')
-    if any(kw in method_lower for kw in ['nms', 'non-maximum', 'suppression']):
+    if not found.isdisjoint(_NMS_KEYWORDS):
         techniques.append('nms_acceleration')
-    if any(kw in method_lower for kw in ['topology', 'structure', 'bottleneck', 'restructure']):
+    if not found.isdisjoint(_TOPOLOGY_KEYWORDS):
         techniques.append('topology_optimization')
-    if any(kw in method_lower for kw in ['decompose', 'svd', 'factorization']):
+    if not found.isdisjoint(_DECOMPOSITION_KEYWORDS):
         techniques.append('decompose_svd')
-    if any(kw in method_lower for kw in ['token', 'merge', 'merging']):
+    if not found.isdisjoint(_TOKEN_MERGING_KEYWORDS):
         techniques.append('token_merging')
     
-    return techniques if techniques else []
+    return tuple(techniques)
 
 
 def _parse_numeric_value(value: Any) -> float:
@@ -195,26 +263,28 @@ def _parse_numeric_value(value: Any) -> float:
         return float(value)
     
     if isinstance(value, str):
-        # Remove common suffixes
-        cleaned = value.replace('×', '').replace('x', '').replace('X', '').strip()
-        try:
-            return float(cleaned)
-        except ValueError:
-            pass
+        return _parse_numeric_string(value)
     
     return 1.0  # Default fallback
 
 
+@lru_cache(maxsize=1024)
+def _parse_numeric_string(value: str) -> float:
+    """Parse a ratio string such as "1.25×"; cached since a few values repeat everywhere."""
+    # Remove common suffixes
+    cleaned = value.replace('×', '').replace('x', '').replace('X', '').strip()
+    try:
+        return float(cleaned)
+    except ValueError:
+        return 1.0  # Default fallback
+
+
 def _migrate_performance(node_data: Dict[str, Any]) -> Dict[str, Any]:
     """Migrate performance data to structured dict format."""
-    performance = {}
-    
-    # If performance already exists as a dict, use it (but ensure required fields)
-    if 'performance' in node_data and isinstance(node_data['performance'], dict):
-        performance = node_data['performance'].copy()
-    else:
-        # Migrate from top-level fields
-        performance = {}
+    # If performance already exists as a dict, use it (but ensure required fields),
+    # otherwise migrate from top-level fields
+    existing = node_data.get('performance')
+    performance = existing.copy() if isinstance(existing, dict) else {}
     
     # Extract from top-level fields
     if 'latency_speedup' not in performance:
@@ -252,14 +322,19 @@ def _migrate_performance(node_data: Dict[str, Any]) -> Dict[str, Any]:
 
 def _migrate_validation(node_data: Dict[str, Any]) -> Dict[str, Any]:
     """Migrate validation data to structured dict format."""
-    validation = {}
+    existing = node_data.get('validation')
+    if not isinstance(existing, dict):
+        # Nothing to merge: build the whole dict from top-level fields in one go
+        return {
+            'confidence': node_data.get('confidence', 0.5),
+            'sample_count': node_data.get('sample_count', 0),  # 0 = unknown
+            'validators': node_data.get('validators', 0),
+            'last_validated': node_data.get('last_validated'),
+            'validation_method': node_data.get('validation_method', _UNKNOWN_METHOD),
+        }
     
     # If validation already exists as a dict, use it (but ensure required fields)
-    if 'validation' in node_data and isinstance(node_data['validation'], dict):
-        validation = node_data['validation'].copy()
-    else:
-        # Migrate from top-level fields
-        validation = {}
+    validation = existing.copy()
     
     # Extract confidence from top-level if not in validation dict
     if 'confidence' not in validation:
@@ -276,7 +351,7 @@ def _migrate_validation(node_data: Dict[str, Any]) -> Dict[str, Any]:
         validation['last_validated'] = node_data.get('last_validated')
     
     if 'validation_method' not in validation:
-        validation['validation_method'] = node_data.get('validation_method', 'unknown')
+        validation['validation_method'] = node_data.get('validation_method', _UNKNOWN_METHOD)
     
     return validation
 
@@ -289,20 +364,20 @@ def _migrate_architecture(node_data: Dict[str, Any]) -> Dict[str, Any]:
         # Already in dict format, ensure it has required fields
         architecture = arch.copy()
         if 'family' not in architecture:
-            architecture['family'] = node_data.get('architecture_family', 'Unknown')
+            architecture['family'] = node_data.get('architecture_family', _UNKNOWN)
         if 'variant' not in architecture:
-            architecture['variant'] = architecture.get('name', 'Unknown')
+            architecture['variant'] = architecture.get('name', _UNKNOWN)
     elif isinstance(arch, str):
         # Convert string to dict
         architecture = {
-            'family': node_data.get('architecture_family', 'Unknown'),
+            'family': node_data.get('architecture_family', _UNKNOWN),
             'variant': arch
         }
     else:
         # Default structure
         architecture = {
-            'family': node_data.get('architecture_family', 'Unknown'),
-            'variant': 'Unknown'
+            'family': node_data.get('architecture_family', _UNKNOWN),
+            'variant': _UNKNOWN
         }
     
     return architecture
@@ -310,33 +385,26 @@ def _migrate_architecture(node_data: Dict[str, Any]) -> Dict[str, Any]:
 
 def _migrate_paper(node_data: Dict[str, Any]) -> Dict[str, Any]:
     """Migrate paper metadata to structured dict format."""
-    paper = {}
-    
     # If paper already exists as a dict, use it
-    if 'paper' in node_data and isinstance(node_data['paper'], dict):
-        paper = node_data['paper'].copy()
-    else:
-        # Try to extract from source field
-        source = node_data.get('source', {})
-        if isinstance(source, dict):
-            paper_refs = source.get('paper_refs', [])
-            if paper_refs and isinstance(paper_refs, list) and len(paper_refs) > 0:
-                # Use first paper ref as title
-                paper['title'] = paper_refs[0] if isinstance(paper_refs[0], str) else ''
-            else:
-                paper['title'] = ''
-        else:
-            paper['title'] = ''
+    existing = node_data.get('paper')
+    paper = existing.copy() if isinstance(existing, dict) else {}
     
-    # Ensure all fields exist (use defaults if missing)
+    # Title falls back to the first source paper ref, then the legacy paper_title field
     if 'title' not in paper:
-        paper['title'] = node_data.get('paper_title', '')
+        title = ''
+        source = node_data.get('source')
+        if isinstance(source, dict):
+            paper_refs = source.get('paper_refs')
+            if paper_refs and isinstance(paper_refs, list) and isinstance(paper_refs[0], str):
+                title = paper_refs[0]
+        paper['title'] = title or node_data.get('paper_title', '')
     
     if 'authors' not in paper:
         authors = node_data.get('authors', '')
         if isinstance(authors, str):
-            # Try to parse comma-separated authors
-            paper['authors'] = [a.strip() for a in authors.split(',') if a.strip()] if authors else []
+            # Try to parse comma-separated authors (strip each name once)
+            stripped = (a.strip() for a in authors.split(','))
+            paper['authors'] = [a for a in stripped if a]
         elif isinstance(authors, list):
             paper['authors'] = authors
         else:
@@ -367,6 +435,69 @@ def _migrate_paper(node_data: Dict[str, Any]) -> Dict[str, Any]:
     return paper
 
 
+# Fields each migrated sub-dict always ends up with; a node that already has all
+# of them comes out of _build_migrated_node unchanged
+_IDEAL_SUBFIELDS = (
+    ('performance', ('latency_speedup', 'compression_ratio', 'accuracy_retention', 'memory_reduction')),
+    ('validation', ('confidence', 'sample_count', 'validators', 'last_validated', 'validation_method')),
+    ('architecture', ('family', 'variant')),
+    ('paper', ('title', 'authors', 'venue', 'year', 'arxiv_id', 'url')),
+)
+
+
+def _is_ideal_node(node_data: Dict[str, Any]) -> bool:
+    """Check whether migrating node_data would only reproduce it."""
+    if not node_data.get('techniques') or 'architecture_family' not in node_data:
+        return False
+    for field, required in _IDEAL_SUBFIELDS:
+        sub = node_data.get(field)
+        if not isinstance(sub, dict):
+            return False
+        for key in required:
+            if key not in sub:
+                return False
+    return True
+
+
+def _build_migrated_node(node_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Build the migrated node dict from scratch.
+    
+    Migrated fields are inserted first and the remaining original fields are
+    filled in afterwards, instead of copying node_data and overwriting slots.
+    The field helpers only read source fields, so they can all read node_data.
+    """
+    migrated: Dict[str, Any] = {}
+    
+    # Migrate techniques
+    if not node_data.get('techniques'):
+        method_name = node_data.get('method_name') or node_data.get('name', '')
+        techniques = extract_techniques_from_method_name(method_name)
+        if techniques:
+            migrated['techniques'] = techniques
+    
+    # Migrate performance
+    migrated['performance'] = _migrate_performance(node_data)
+    
+    # Migrate validation
+    migrated['validation'] = _migrate_validation(node_data)
+    
+    # Migrate architecture
+    architecture = _migrate_architecture(node_data)
+    migrated['architecture'] = architecture
+    # Keep architecture_family for backward compatibility
+    if 'architecture_family' not in node_data:
+        migrated['architecture_family'] = architecture['family']
+    
+    # Migrate paper
+    migrated['paper'] = _migrate_paper(node_data)
+    
+    # Carry over all remaining original fields
+    for key, value in node_data.items():
+        migrated.setdefault(key, value)
+    
+    return migrated
+
+
 def migrate_node_to_ideal_schema(node_data: Dict[str, Any], node_id: Optional[str] = None) -> Dict[str, Any]:
     """Migrate a single node from old format to ideal schema.
     
@@ -380,8 +511,6 @@ def migrate_node_to_ideal_schema(node_data: Dict[str, Any], node_id: Optional[st
     if not isinstance(node_data, dict):
         return node_data
     
-    migrated = node_data.copy()
-    
     # Detect old format
     is_old_format = (
         'techniques' not in node_data or
@@ -402,30 +531,89 @@ def migrate_node_to_ideal_schema(node_data: Dict[str, Any], node_id: Optional[st
             stacklevel=2
         )
     
-    # Migrate techniques
-    if 'techniques' not in migrated or not migrated['techniques']:
-        method_name = migrated.get('method_name') or migrated.get('name', '')
-        techniques = extract_techniques_from_method_name(method_name)
-        if techniques:
-            migrated['techniques'] = techniques
-    
-    # Migrate performance
-    migrated['performance'] = _migrate_performance(migrated)
-    
-    # Migrate validation
-    migrated['validation'] = _migrate_validation(migrated)
-    
-    # Migrate architecture
-    architecture = _migrate_architecture(migrated)
-    migrated['architecture'] = architecture
-    # Keep architecture_family for backward compatibility
-    if 'architecture_family' not in migrated:
-        migrated['architecture_family'] = architecture['family']
-    
-    # Migrate paper
-    migrated['paper'] = _migrate_paper(migrated)
+    return _build_migrated_node(node_data)
+
+
+def _infer_architecture_family(model_data: Dict[str, Any]) -> str:
+    """Infer architecture family from a model's model_characteristics.architecture_type."""
+    model_characteristics = model_data.get('model_characteristics', {})
+    architecture_type = model_characteristics.get('architecture_type', _UNKNOWN)
+    architecture_family = architecture_type.upper() if architecture_type else _UNKNOWN
+    if architecture_type == 'cnn':
+        architecture_family = 'CNN'
+    elif architecture_type == 'transformer':
+        architecture_family = 'Transformer'
+    elif architecture_type == 'hybrid':
+        architecture_family = 'Hybrid'
+    elif architecture_type == 'multimodal':
+        architecture_family = 'Multimodal'
+    return architecture_family
+
+
+def _migrate_method(
+    method: Any,
+    source_data: Dict[str, Any],
+    variant: str,
+    get_architecture_family: Callable[[], str],
+) -> Any:
+    """Migrate one entry of a methods list; see _migrate_methods."""
+    if isinstance(method, str):
+        # Legacy string format - convert to object
+        architecture_family = get_architecture_family()
+        return {
+            'name': method,
+            'method_name': method,
+            'techniques': extract_techniques_from_method_name(method),
+            'performance': _migrate_performance(source_data),
+            'validation': _migrate_validation(source_data),
+            'paper': _migrate_paper(source_data),
+            'effectiveness': source_data.get('effectiveness', _MEDIUM),
+            'accuracy_impact': source_data.get('accuracy_impact', _MINIMAL),
+            # Add architecture from model context
+            'architecture': {
+                'family': architecture_family,
+                'variant': variant
+            },
+            'architecture_family': architecture_family
+        }
+    if isinstance(method, dict):
+        if _is_ideal_node(method):
+            # Already fully migrated (e.g. re-migrating a migrated tree) - share it
+            return method
+        # Already an object - migrate it, but add architecture if missing
+        migrated_method = migrate_node_to_ideal_schema(method)
+        if not migrated_method.get('architecture') or isinstance(migrated_method.get('architecture'), str):
+            architecture_family = get_architecture_family()
+            migrated_method['architecture'] = {
+                'family': architecture_family,
+                'variant': variant
+            }
+            migrated_method['architecture_family'] = architecture_family
+        return migrated_method
+    return method
+
+
+def _migrate_methods(
+    methods: List[Any],
+    source_data: Dict[str, Any],
+    model_name: str,
+    get_architecture_family: Callable[[], str],
+) -> List[Any]:
+    """Migrate a list of methods (legacy strings or dicts) to ideal schema.
     
-    return migrated
+    Args:
+        methods: The methods list from a category or subcategory
+        source_data: The category/subcategory dict holding shared metadata for legacy string methods
+        model_name: Model key used as architecture variant (e.g., 'resnet')
+        get_architecture_family: Lazily computes the model's architecture family;
+            only called when a method actually needs it
+    """
+    variant = model_name.capitalize()
+    migrate_method = _migrate_method
+    return [
+        migrate_method(method, source_data, variant, get_architecture_family)
+        for method in methods
+    ]
 
 
 def migrate_taxonomy_to_ideal_schema(taxonomy: Dict[str, Any]) -> Dict[str, Any]:
@@ -453,22 +641,17 @@ def migrate_taxonomy_to_ideal_schema(taxonomy: Dict[str, Any]) -> Dict[str, Any]
                 migrated_model = value.copy()
                 opt_methods = migrated_model.get('optimization_methods', {})
                 
-                # Extract architecture info from model characteristics for context
-                model_characteristics = migrated_model.get('model_characteristics', {})
-                architecture_type = model_characteristics.get('architecture_type', 'Unknown')
-                # Try to infer architecture family from architecture_type
-                architecture_family = architecture_type.upper() if architecture_type else 'Unknown'
-                if architecture_type == 'cnn':
-                    architecture_family = 'CNN'
-                elif architecture_type == 'transformer':
-                    architecture_family = 'Transformer'
-                elif architecture_type == 'hybrid':
-                    architecture_family = 'Hybrid'
-                elif architecture_type == 'multimodal':
-                    architecture_family = 'Multimodal'
+                # Architecture family is only needed for methods lacking their own
+                # architecture dict, so infer it lazily and at most once per model
+                architecture_family_cache: List[str] = []
+                
+                def get_architecture_family() -> str:
+                    if not architecture_family_cache:
+                        architecture_family_cache.append(_infer_architecture_family(migrated_model))
+                    return architecture_family_cache[0]
                 
                 # Get model name from key (e.g., 'resnet', 'vgg')
-                model_name = key if key else 'Unknown'
+                model_name = key if key else _UNKNOWN
                 
                 if isinstance(opt_methods, dict):
                     migrated_opt_methods = {}
@@ -485,83 +668,17 @@ def migrate_taxonomy_to_ideal_schema(taxonomy: Dict[str, Any]) -> Dict[str, Any]
                             if 'methods' in category_data:
                                 # Flat structure: category -> methods (list)
                                 methods = category_data.get('methods', [])
-                                migrated_methods = []
-                                
-                                for method in methods:
-                                    if isinstance(method, str):
-                                        # Legacy string format - convert to object
-                                        migrated_method = {
-                                            'name': method,
-                                            'method_name': method,
-                                            'techniques': extract_techniques_from_method_name(method),
-                                            'performance': _migrate_performance(category_data),
-                                            'validation': _migrate_validation(category_data),
-                                            'paper': _migrate_paper(category_data),
-                                            'effectiveness': category_data.get('effectiveness', 'medium'),
-                                            'accuracy_impact': category_data.get('accuracy_impact', 'minimal'),
-                                            # Add architecture from model context
-                                            'architecture': {
-                                                'family': architecture_family,
-                                                'variant': model_name.capitalize()
-                                            },
-                                            'architecture_family': architecture_family
-                                        }
-                                        migrated_methods.append(migrated_method)
-                                    elif isinstance(method, dict):
-                                        # Already an object - migrate it, but add architecture if missing
-                                        migrated_method = migrate_node_to_ideal_schema(method)
-                                        if not migrated_method.get('architecture') or isinstance(migrated_method.get('architecture'), str):
-                                            migrated_method['architecture'] = {
-                                                'family': architecture_family,
-                                                'variant': model_name.capitalize()
-                                            }
-                                            migrated_method['architecture_family'] = architecture_family
-                                        migrated_methods.append(migrated_method)
-                                    else:
-                                        migrated_methods.append(method)
-                                
-                                migrated_category['methods'] = migrated_methods
+                                migrated_category['methods'] = _migrate_methods(
+                                    methods, category_data, model_name, get_architecture_family
+                                )
                             else:
                                 # Nested structure: category -> subcategory -> methods
                                 for subcat_name, subcat_data in category_data.items():
                                     if isinstance(subcat_data, dict) and 'methods' in subcat_data:
                                         methods = subcat_data.get('methods', [])
-                                        migrated_methods = []
-                                        
-                                        for method in methods:
-                                            if isinstance(method, str):
-                                                # Legacy string format
-                                                migrated_method = {
-                                                    'name': method,
-                                                    'method_name': method,
-                                                    'techniques': extract_techniques_from_method_name(method),
-                                                    'performance': _migrate_performance(subcat_data),
-                                                    'validation': _migrate_validation(subcat_data),
-                                                    'paper': _migrate_paper(subcat_data),
-                                                    'effectiveness': subcat_data.get('effectiveness', 'medium'),
-                                                    'accuracy_impact': subcat_data.get('accuracy_impact', 'minimal'),
-                                                    # Add architecture from model context
-                                                    'architecture': {
-                                                        'family': architecture_family,
-                                                        'variant': model_name.capitalize()
-                                                    },
-                                                    'architecture_family': architecture_family
-                                                }
-                                                migrated_methods.append(migrated_method)
-                                            elif isinstance(method, dict):
-                                                # Already an object - migrate it, but add architecture if missing
-                                                migrated_method = migrate_node_to_ideal_schema(method)
-                                                if not migrated_method.get('architecture') or isinstance(migrated_method.get('architecture'), str):
-                                                    migrated_method['architecture'] = {
-                                                        'family': architecture_family,
-                                                        'variant': model_name.capitalize()
-                                                    }
-                                                    migrated_method['architecture_family'] = architecture_family
-                                                migrated_methods.append(migrated_method)
-                                            else:
-                                                migrated_methods.append(method)
-                                        
-                                        subcat_data['methods'] = migrated_methods
+                                        subcat_data['methods'] = _migrate_methods(
+                                            methods, subcat_data, model_name, get_architecture_family
+                                        )
                             
                             migrated_opt_methods[normalized_category] = migrated_category
                         else:
@@ -579,4 +696,3 @@ def migrate_taxonomy_to_ideal_schema(taxonomy: Dict[str, Any]) -> Dict[str, Any]
             migrated[key] = value
     
     return migrated
-
@@ -1,17 +1,93 @@
 from __future__ import annotations
 
 import json
+import mmap
 import os
-from typing import Any, Dict, List, Optional
+import sys
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
 
-from federated_api.database import tree_repository
-from federated_api.services.validation_service import ValidationService
+import orjson
+
+from federated_api.database import TreeNotFoundError, tree_repository
+from federated_api.services.validation_service import default_validation_service
 from federated_api.services.migration_service import migrate_taxonomy_to_ideal_schema
 
+T = TypeVar("T")
+
+# Project root (where run_local.py is), up from src/federated_api/services
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+# Categories returned by get_optimization_methods, in response order
+_METHOD_CATEGORIES = ('quantization', 'fusion', 'pruning', 'structural')
+
+# Legacy category names and the schema category they map to
+_CATEGORY_RENAMES = {'weight_quantization': 'quantization'}
+
+# Subcategory that a flat list of method names is wrapped in, per category
+_DEFAULT_SUBCATEGORIES = {
+    'quantization': 'weight_only',
+    'fusion': 'layer_fusion',
+    'pruning': 'structured',
+    'structural': 'topology',
+}
+
+
+@lru_cache(maxsize=4096)
+def _split_path(path: str) -> tuple:
+    """Split a taxonomy path into interned parts (cached; the set of paths is small)."""
+    return tuple(sys.intern(part) for part in path.split('/'))
+
+
+def _load_json_file(f: Any) -> Any:
+    """Parse an open binary JSON file straight from a read-only memory map."""
+    if os.fstat(f.fileno()).st_size == 0:
+        # mmap cannot map an empty file; let orjson report the empty document
+        return orjson.loads(b'')
+    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+        return orjson.loads(view)
+
+
+def _get_or_create(node: Dict[str, Any], key: str) -> Any:
+    """Return node[key], adding an empty dict only if it is missing (setdefault always builds one)."""
+    try:
+        return node[key]
+    except KeyError:
+        child = node[key] = {}
+        return child
+
+
+# tree_id -> (repository revision, relationship id -> relationship,
+# path filter -> matching relationships). Shared by all TreeService instances,
+# since the routes each hold their own.
+_RelationshipIndex = Tuple[int, Dict[str, Dict[str, Any]], Dict[str, List[Dict[str, Any]]]]
+_relationship_indices: Dict[str, _RelationshipIndex] = {}
+
+# Upper bound on memoized get_relationships(path=...) results per tree revision
+_MAX_CACHED_FILTERS = 256
+
+
+def _build_relationship_index(taxonomy: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    """Map relationship ids to relationships, keeping the first one for duplicate ids."""
+    index: Dict[str, Dict[str, Any]] = {}
+    relationships = taxonomy.get('relationships', [])
+    if isinstance(relationships, list):
+        for rel in relationships:
+            if isinstance(rel, dict):
+                index.setdefault(rel.get('id'), rel)
+    return index
+
+
+def _evict_relationship_index(tree_id: str) -> None:
+    _relationship_indices.pop(tree_id, None)
+
+
+tree_repository.add_delete_listener(_evict_relationship_index)
+
 
 class TreeService:
     def __init__(self):
-        self.validation_service = ValidationService()
+        self.validation_service = default_validation_service
 
     def clone(self, architecture: str, constraints: Dict[str, Any]) -> Dict[str, Any]:
         """Create a new empty taxonomy structure."""
@@ -19,7 +95,7 @@ class TreeService:
         # Validate the empty structure (should pass)
         self.validation_service.validate_schema_structure(taxonomy)
         tree_id = tree_repository.create(taxonomy)
-        taxonomy = tree_repository.get(tree_id) or {}
+        # create() stores this exact dict, so no need to read it back
         return {"tree_id": tree_id, "taxonomy": taxonomy}
 
     def expand(self, tree_id: str, architecture: str, path: Optional[str] = None) -> Dict[str, Any]:
@@ -38,10 +114,10 @@ class TreeService:
 
     def get_model_family(self, tree_id: str, family_name: str) -> Optional[Dict[str, Any]]:
         """Get a specific model family."""
-        taxonomy = tree_repository.get(tree_id)
-        if taxonomy is None:
+        try:
+            return tree_repository.get_subtree(tree_id, (family_name,))
+        except TreeNotFoundError:
             raise ValueError(f"Taxonomy not found: {tree_id}")
-        return taxonomy.get(family_name)
 
     def get_path(self, tree_id: str, path: str) -> Optional[Any]:
         """Get data at a specific path (e.g., 'model_family/subcategory/specific_model')."""
@@ -50,36 +126,33 @@ class TreeService:
             raise ValueError(f"Taxonomy not found: {tree_id}")
         
         self.validation_service.validate_path(path)
-        parts = path.split('/')
         current = taxonomy
-        for part in parts:
-            if not isinstance(current, dict) or part not in current:
-                return None
-            current = current[part]
+        try:
+            for part in _split_path(path):
+                current = current[part]
+        except (KeyError, TypeError):
+            # Missing key, or walked into a non-dict value (list, string, number)
+            return None
         return current
 
     def get_optimization_methods(self, tree_id: str, path: str) -> Optional[List[Dict[str, Any]]]:
         """Get optimization methods for a specific model path."""
         model_data = self.get_path(tree_id, path)
-        if model_data is None or not isinstance(model_data, dict):
-            return None
         
-        opt_methods = model_data.get('optimization_methods', {})
-        if not isinstance(opt_methods, dict):
+        # Collect all methods from all categories, assuming the validated shape
+        # (category -> subcategory -> {'methods': [...]}) and bailing out otherwise
+        try:
+            opt_methods = model_data['optimization_methods']
+            all_methods = [
+                method
+                for category in _METHOD_CATEGORIES
+                if category in opt_methods
+                for subcat_data in opt_methods[category].values()
+                for method in subcat_data['methods']
+            ]
+        except (AttributeError, KeyError, TypeError):
             return None
         
-        # Collect all methods from all categories
-        all_methods = []
-        for category in ['quantization', 'fusion', 'pruning', 'structural']:
-            if category in opt_methods:
-                category_data = opt_methods[category]
-                if isinstance(category_data, dict):
-                    for subcat_name, subcat_data in category_data.items():
-                        if isinstance(subcat_data, dict) and 'methods' in subcat_data:
-                            methods = subcat_data['methods']
-                            if isinstance(methods, list):
-                                all_methods.extend(methods)
-        
         return all_methods if all_methods else None
 
     def add_optimization_method(
@@ -91,44 +164,49 @@ class TreeService:
         method_data: Dict[str, Any]
     ) -> None:
         """Add an optimization method to a specific path."""
-        taxonomy = tree_repository.get(tree_id)
-        if taxonomy is None:
-            raise ValueError(f"Taxonomy not found: {tree_id}")
+        self.add_optimization_methods(tree_id, path, category, subcategory, [method_data])
+
+    def add_optimization_methods(
+        self, 
+        tree_id: str, 
+        path: str, 
+        category: str, 
+        subcategory: str, 
+        methods_data: List[Dict[str, Any]]
+    ) -> None:
+        """Add several optimization methods to the same path in one pass.
         
+        Each method is validated up front, then the batch is appended and the
+        tree is validated and stored once instead of once per method.
+        """
+        # Everything is checked before the stored tree is touched, since a failed
+        # mutation still leaves its partial edits in place
         self.validation_service.validate_path(path)
-        self.validation_service.validate_method_data(method_data)
-        
-        # Navigate to the model
-        parts = path.split('/')
-        if len(parts) < 3:
-            raise ValueError("Path must be at least model_family/subcategory/specific_model")
-        
-        current = taxonomy
-        for part in parts:
-            if part not in current:
-                current[part] = {}
-            current = current[part]
-        
-        # Ensure optimization_methods structure exists
-        if 'optimization_methods' not in current:
-            current['optimization_methods'] = {}
-        
-        opt_methods = current['optimization_methods']
-        
-        # Ensure category exists
-        if category not in opt_methods:
-            opt_methods[category] = {}
-        
-        # Ensure subcategory exists
-        if subcategory not in opt_methods[category]:
-            opt_methods[category][subcategory] = {'methods': []}
-        
-        # Add the method
-        opt_methods[category][subcategory]['methods'].append(method_data)
+        self.validation_service.validate_category_name(category)
+        for method_data in methods_data:
+            self.validation_service.validate_method_data(method_data)
+        
+        # Navigate to the model (validate_path guarantees at least three parts)
+        parts = _split_path(path)
+        
+        def apply(taxonomy: Dict[str, Any]) -> None:
+            # Create any missing levels along the way
+            current = taxonomy
+            for part in parts:
+                current = _get_or_create(current, part)
+            
+            # Ensure optimization_methods/category/subcategory structure exists and add the methods
+            subcategory_data = _get_or_create(
+                _get_or_create(_get_or_create(current, 'optimization_methods'), category),
+                subcategory,
+            )
+            methods = subcategory_data.setdefault('methods', [])
+            methods.extend(methods_data)
+            
+            # Validate the updated slot (the rest of the taxonomy is unchanged)
+            self.validation_service.validate_subtree(current, category, subcategory)
         
-        # Validate the updated structure
-        self.validation_service.validate_schema_structure(taxonomy)
-        tree_repository.upsert(tree_id, taxonomy)
+        self._mutate(tree_id, apply)
 
     def update_optimization_method(
         self, 
@@ -140,43 +218,40 @@ class TreeService:
         updates: Dict[str, Any]
     ) -> None:
         """Update an existing optimization method."""
-        taxonomy = tree_repository.get(tree_id)
-        if taxonomy is None:
-            raise ValueError(f"Taxonomy not found: {tree_id}")
-        
         self.validation_service.validate_path(path)
         
-        # Navigate to the methods list
-        parts = path.split('/')
-        current = taxonomy
-        for part in parts:
-            if part not in current:
-                raise ValueError(f"Path not found: {path}")
-            current = current[part]
-        
-        if 'optimization_methods' not in current:
-            raise ValueError(f"No optimization_methods found at path: {path}")
-        
-        opt_methods = current['optimization_methods']
-        if category not in opt_methods:
-            raise ValueError(f"Category '{category}' not found")
-        
-        if subcategory not in opt_methods[category]:
-            raise ValueError(f"Subcategory '{subcategory}' not found in category '{category}'")
-        
-        methods = opt_methods[category][subcategory].get('methods', [])
-        if not isinstance(methods, list) or method_index < 0 or method_index >= len(methods):
-            raise ValueError(f"Invalid method index: {method_index}")
-        
-        # Update the method
-        methods[method_index].update(updates)
-        
-        # Validate the updated method
-        self.validation_service.validate_optimization_method(methods[method_index])
+        def apply(taxonomy: Dict[str, Any]) -> None:
+            # Navigate to the methods list
+            current = self._get_model(taxonomy, path)
+            
+            try:
+                opt_methods = current['optimization_methods']
+            except (KeyError, TypeError, AttributeError):
+                raise ValueError(f"No optimization_methods found at path: {path}")
+            
+            try:
+                subcategories = opt_methods[category]
+            except (KeyError, TypeError, AttributeError):
+                raise ValueError(f"Category '{category}' not found")
+            
+            try:
+                methods = subcategories[subcategory].get('methods', [])
+            except (KeyError, TypeError, AttributeError):
+                raise ValueError(f"Subcategory '{subcategory}' not found in category '{category}'")
+            
+            if not isinstance(methods, list) or method_index < 0 or method_index >= len(methods):
+                raise ValueError(f"Invalid method index: {method_index}")
+            
+            # Validate the updated method before writing it into the stored tree
+            self.validation_service.validate_optimization_method({**methods[method_index], **updates})
+            
+            # Update the method
+            methods[method_index].update(updates)
+            
+            # Validate the updated slot (the rest of the taxonomy is unchanged)
+            self.validation_service.validate_subtree(current, category, subcategory)
         
-        # Validate the entire structure
-        self.validation_service.validate_schema_structure(taxonomy)
-        tree_repository.upsert(tree_id, taxonomy)
+        self._mutate(tree_id, apply)
 
     def remove_optimization_method(
         self, 
@@ -187,41 +262,28 @@ class TreeService:
         method_index: int
     ) -> bool:
         """Remove an optimization method."""
-        taxonomy = tree_repository.get(tree_id)
-        if taxonomy is None:
-            raise ValueError(f"Taxonomy not found: {tree_id}")
-        
         self.validation_service.validate_path(path)
         
-        # Navigate to the methods list
-        parts = path.split('/')
-        current = taxonomy
-        for part in parts:
-            if part not in current:
-                raise ValueError(f"Path not found: {path}")
-            current = current[part]
-        
-        if 'optimization_methods' not in current:
-            return False
-        
-        opt_methods = current['optimization_methods']
-        if category not in opt_methods:
-            return False
-        
-        if subcategory not in opt_methods[category]:
-            return False
-        
-        methods = opt_methods[category][subcategory].get('methods', [])
-        if not isinstance(methods, list) or method_index < 0 or method_index >= len(methods):
-            return False
-        
-        # Remove the method
-        methods.pop(method_index)
+        def apply(taxonomy: Dict[str, Any]) -> bool:
+            # Navigate to the methods list
+            current = self._get_model(taxonomy, path)
+            
+            try:
+                methods = current['optimization_methods'][category][subcategory].get('methods', [])
+            except (KeyError, TypeError, AttributeError):
+                return False
+            
+            if not isinstance(methods, list) or method_index < 0 or method_index >= len(methods):
+                return False
+            
+            # Remove the method
+            methods.pop(method_index)
+            
+            # Validate the updated slot (the rest of the taxonomy is unchanged)
+            self.validation_service.validate_subtree(current, category, subcategory)
+            return True
         
-        # Validate the updated structure
-        self.validation_service.validate_schema_structure(taxonomy)
-        tree_repository.upsert(tree_id, taxonomy)
-        return True
+        return self._mutate(tree_id, apply)
 
     def add_relationship(
         self,
@@ -229,60 +291,58 @@ class TreeService:
         relationship_data: Dict[str, Any]
     ) -> str:
         """Add a relationship between methods with weights."""
-        taxonomy = tree_repository.get(tree_id)
-        if taxonomy is None:
-            raise ValueError(f"Taxonomy not found: {tree_id}")
-        
-        # Validate relationship data
-        self.validation_service.validate_relationship(relationship_data, taxonomy)
-        
-        # Generate ID if not provided
-        if 'id' not in relationship_data:
-            relationship_data['id'] = tree_repository.new_id()
-        
-        # Store relationships at top level (in taxonomy root)
-        if 'relationships' not in taxonomy:
-            taxonomy['relationships'] = []
-        
-        if not isinstance(taxonomy['relationships'], list):
-            taxonomy['relationships'] = []
-        
-        taxonomy['relationships'].append(relationship_data)
-        
-        # Validate the updated structure
-        self.validation_service.validate_schema_structure(taxonomy)
-        tree_repository.upsert(tree_id, taxonomy)
+        def apply(taxonomy: Dict[str, Any]) -> str:
+            # Validate relationship data
+            self.validation_service.validate_relationship(relationship_data, taxonomy)
+            
+            # Generate ID if not provided
+            if 'id' not in relationship_data:
+                relationship_data['id'] = tree_repository.new_id()
+            
+            # Store relationships at top level (in taxonomy root)
+            if 'relationships' not in taxonomy:
+                taxonomy['relationships'] = []
+            
+            if not isinstance(taxonomy['relationships'], list):
+                taxonomy['relationships'] = []
+            
+            # Only the new relationship changed and it was validated above,
+            # so the rest of the taxonomy does not need to be re-walked
+            taxonomy['relationships'].append(relationship_data)
+            
+            return relationship_data['id']
         
-        return relationship_data['id']
+        return self._mutate(tree_id, apply)
 
     def get_relationships(self, tree_id: str, path: Optional[str] = None) -> List[Dict[str, Any]]:
         """Get all relationships, optionally filtered by path."""
-        taxonomy = tree_repository.get(tree_id)
-        if taxonomy is None:
-            raise ValueError(f"Taxonomy not found: {tree_id}")
+        taxonomy, index = self._get_relationship_index(tree_id)
         
         relationships = taxonomy.get('relationships', [])
         if not isinstance(relationships, list):
             return []
         
         # If path is provided, filter relationships that involve this path
+        # (a substring match, which also covers prefixes); results are reused
+        # until the tree is written again
         if path:
-            filtered = []
-            for rel in relationships:
-                methods = rel.get('methods', [])
-                if any(path in method_path or method_path.startswith(path) for method_path in methods):
-                    filtered.append(rel)
+            filter_cache = index[2]
+            filtered = filter_cache.get(path)
+            if filtered is None:
+                filtered = [
+                    rel for rel in relationships
+                    if any(path in method_path for method_path in rel.get('methods', []))
+                ]
+                if len(filter_cache) < _MAX_CACHED_FILTERS:
+                    filter_cache[path] = filtered
             return filtered
         
         return relationships
 
     def get_relationship(self, tree_id: str, relationship_id: str) -> Optional[Dict[str, Any]]:
         """Get a specific relationship by ID."""
-        relationships = self.get_relationships(tree_id)
-        for rel in relationships:
-            if rel.get('id') == relationship_id:
-                return rel
-        return None
+        _, index = self._get_relationship_index(tree_id)
+        return index[1].get(relationship_id)
 
     def update_relationship(
         self,
@@ -291,54 +351,86 @@ class TreeService:
         updates: Dict[str, Any]
     ) -> None:
         """Update an existing relationship."""
-        taxonomy = tree_repository.get(tree_id)
-        if taxonomy is None:
-            raise ValueError(f"Taxonomy not found: {tree_id}")
+        def apply(taxonomy: Dict[str, Any]) -> None:
+            relationships = taxonomy.get('relationships', [])
+            if not isinstance(relationships, list):
+                raise ValueError("No relationships found")
+            
+            # Find and update the relationship
+            found = False
+            for i, rel in enumerate(relationships):
+                if rel.get('id') == relationship_id:
+                    # Don't allow updating the ID
+                    updates.pop('id', None)
+                    relationships[i].update(updates)
+                    # Validate the updated relationship
+                    self.validation_service.validate_relationship(relationships[i], taxonomy)
+                    found = True
+                    break
+            
+            if not found:
+                raise ValueError(f"Relationship not found: {relationship_id}")
         
-        relationships = taxonomy.get('relationships', [])
-        if not isinstance(relationships, list):
-            raise ValueError("No relationships found")
-        
-        # Find and update the relationship
-        found = False
-        for i, rel in enumerate(relationships):
-            if rel.get('id') == relationship_id:
-                # Don't allow updating the ID
-                updates.pop('id', None)
-                relationships[i].update(updates)
-                # Validate the updated relationship
-                self.validation_service.validate_relationship(relationships[i], taxonomy)
-                found = True
-                break
-        
-        if not found:
-            raise ValueError(f"Relationship not found: {relationship_id}")
-        
-        # Validate the entire structure
-        self.validation_service.validate_schema_structure(taxonomy)
-        tree_repository.upsert(tree_id, taxonomy)
+        self._mutate(tree_id, apply)
 
     def remove_relationship(self, tree_id: str, relationship_id: str) -> bool:
         """Remove a relationship."""
-        taxonomy = tree_repository.get(tree_id)
-        if taxonomy is None:
-            raise ValueError(f"Taxonomy not found: {tree_id}")
-        
-        relationships = taxonomy.get('relationships', [])
-        if not isinstance(relationships, list):
+        # Unknown ids are answered from the id index without writing the tree
+        _, index = self._get_relationship_index(tree_id)
+        if relationship_id not in index[1]:
             return False
         
-        # Find and remove the relationship
-        original_count = len(relationships)
-        taxonomy['relationships'] = [rel for rel in relationships if rel.get('id') != relationship_id]
+        def apply(taxonomy: Dict[str, Any]) -> bool:
+            relationships = taxonomy.get('relationships', [])
+            if not isinstance(relationships, list):
+                return False
+            
+            # Find and remove the relationship in place (every entry with this id,
+            # walking backwards so deletions don't shift the ones still to check)
+            removed = False
+            for i in range(len(relationships) - 1, -1, -1):
+                if relationships[i].get('id') == relationship_id:
+                    del relationships[i]
+                    removed = True
+            
+            # Dropping a relationship cannot invalidate the rest of the taxonomy
+            return removed
         
-        if len(taxonomy['relationships']) < original_count:
-            # Validate the updated structure
-            self.validation_service.validate_schema_structure(taxonomy)
-            tree_repository.upsert(tree_id, taxonomy)
-            return True
+        return self._mutate(tree_id, apply)
+
+    @staticmethod
+    def _get_relationship_index(tree_id: str) -> Tuple[Dict[str, Any], _RelationshipIndex]:
+        """Return a tree and its relationship index, rebuilding the index after writes."""
+        # Read the revision before the tree: if a write lands in between, the index
+        # is stored under the older revision and rebuilt on the next read
+        revision = tree_repository.revision(tree_id)
+        taxonomy = tree_repository.get(tree_id)
+        if taxonomy is None:
+            raise ValueError(f"Taxonomy not found: {tree_id}")
         
-        return False
+        cached = _relationship_indices.get(tree_id)
+        if cached is None or cached[0] != revision:
+            cached = (revision, _build_relationship_index(taxonomy), {})
+            _relationship_indices[tree_id] = cached
+        return taxonomy, cached
+
+    def _mutate(self, tree_id: str, fn: Callable[[Dict[str, Any]], T]) -> T:
+        """Apply fn to the stored taxonomy in a single repository read-modify-write."""
+        try:
+            return tree_repository.mutate(tree_id, fn)
+        except TreeNotFoundError:
+            raise ValueError(f"Taxonomy not found: {tree_id}")
+
+    @staticmethod
+    def _get_model(taxonomy: Dict[str, Any], path: str) -> Any:
+        """Walk an existing path, raising ValueError if any segment is missing."""
+        current = taxonomy
+        try:
+            for part in _split_path(path):
+                current = current[part]
+        except (KeyError, TypeError):
+            raise ValueError(f"Path not found: {path}")
+        return current
 
     def load_from_file(self, tree_id: str, file_path: str) -> Dict[str, Any]:
         """Load taxonomy from a JSON file and update the tree.
@@ -354,24 +446,49 @@ class TreeService:
             FileNotFoundError: If the file doesn't exist
             ValueError: If the file contains invalid JSON or validation fails
         """
+        taxonomy = self._read_taxonomy_file(file_path)
+        
+        # Replace the entire tree (upsert will overwrite if tree_id exists)
+        tree_repository.upsert(tree_id, taxonomy)
+        
+        return {"status": "success", "tree_id": tree_id}
+
+    def bulk_load_from_files(self, files: List[Tuple[str, str]]) -> List[Dict[str, Any]]:
+        """Load several taxonomy files, storing them only if every file loads.
+        
+        Args:
+            files: (tree_id, file_path) pairs; paths are resolved as in load_from_file
+            
+        Returns:
+            One load_from_file-style result per pair, in order
+            
+        Raises:
+            FileNotFoundError: If any file doesn't exist
+            ValueError: If any file contains invalid JSON or validation fails
+        """
+        taxonomies = [(tree_id, self._read_taxonomy_file(file_path)) for tree_id, file_path in files]
+        
+        # All files parsed and validated: write them in one batch
+        tree_repository.upsert_many(taxonomies)
+        
+        return [{"status": "success", "tree_id": tree_id} for tree_id, _ in taxonomies]
+
+    def _read_taxonomy_file(self, file_path: str) -> Dict[str, Any]:
+        """Parse, normalize, migrate and validate a taxonomy file without storing it."""
         # Resolve file path (handle both relative and absolute paths)
         if not os.path.isabs(file_path):
             # If relative, assume it's relative to project root (where run_local.py is)
-            # Get the project root by going up from src/federated_api/services
-            current_dir = os.path.dirname(os.path.abspath(__file__))
-            project_root = os.path.dirname(os.path.dirname(os.path.dirname(current_dir)))
-            file_path = os.path.join(project_root, file_path)
-        
-        # Check if file exists
-        if not os.path.exists(file_path):
-            raise FileNotFoundError(f"File not found: {file_path}")
+            file_path = os.path.join(_PROJECT_ROOT, file_path)
         
-        # Load JSON file
+        # Load JSON file (orjson parses the mapped UTF-8 bytes without copying them);
+        # open() itself reports a missing file, so there is no separate exists() check
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                taxonomy = json.load(f)
+            with open(file_path, 'rb') as f:
+                taxonomy = _load_json_file(f)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"File not found: {file_path}")
         except json.JSONDecodeError as e:
-            # Re-raise with more context
+            # Re-raise with more context (orjson's error subclasses json.JSONDecodeError)
             raise ValueError(f"Invalid JSON in file {file_path}: {e.msg} at line {e.lineno}, column {e.colno}")
         
         # Normalize category names: "weight_quantization" -> "quantization"
@@ -385,10 +502,7 @@ class TreeService:
         # Validate the taxonomy structure
         self.validation_service.validate_schema_structure(taxonomy)
         
-        # Replace the entire tree (upsert will overwrite if tree_id exists)
-        tree_repository.upsert(tree_id, taxonomy)
-        
-        return {"status": "success", "tree_id": tree_id}
+        return taxonomy
 
     def _normalize_category_names(self, taxonomy: Dict[str, Any]) -> Dict[str, Any]:
         """Normalize category names and structure in optimization_methods.
@@ -397,78 +511,47 @@ class TreeService:
         1. "weight_quantization" -> "quantization" to match the expected schema
         2. Flat category structure (category -> methods) to nested structure (category -> subcategory -> methods)
         
-        This handles legacy naming conventions in base_tree.json.
+        This handles legacy naming conventions in base_tree.json. The taxonomy is
+        updated in place (it comes straight from json.load) and returned.
         """
         if not isinstance(taxonomy, dict):
             return taxonomy
         
-        # Recursively process the taxonomy structure
-        normalized = {}
-        for key, value in taxonomy.items():
-            if key == "relationships":
-                # Preserve relationships as-is
-                normalized[key] = value
-            elif isinstance(value, dict):
-                # Check if this is a model with optimization_methods
-                if "optimization_methods" in value:
-                    # Normalize the optimization_methods structure
-                    opt_methods = value["optimization_methods"]
-                    if isinstance(opt_methods, dict):
-                        normalized_opt_methods = {}
-                        for category_name, category_data in opt_methods.items():
-                            # Rename weight_quantization to quantization
-                            if category_name == "weight_quantization":
-                                category_name = "quantization"
-                            
-                            # Check if category_data has "methods" directly (flat structure)
-                            if isinstance(category_data, dict) and "methods" in category_data:
-                                # Check if methods is a list (could be strings or objects)
-                                methods = category_data.get("methods", [])
-                                if isinstance(methods, list) and len(methods) > 0:
-                                    # If first method is a string, this is the flat structure
-                                    # Wrap it in a default subcategory
-                                    if isinstance(methods[0], str):
-                                        # Create a default subcategory name based on category
-                                        subcategory_name = "default"
-                                        if category_name == "quantization":
-                                            subcategory_name = "weight_only"
-                                        elif category_name == "fusion":
-                                            subcategory_name = "layer_fusion"
-                                        elif category_name == "pruning":
-                                            subcategory_name = "structured"
-                                        elif category_name == "structural":
-                                            subcategory_name = "topology"
-                                        
-                                        # Wrap the category data in a subcategory
-                                        normalized_opt_methods[category_name] = {
-                                            subcategory_name: category_data
-                                        }
-                                    else:
-                                        # Methods are already objects, but structure might still be flat
-                                        # Wrap in default subcategory
-                                        subcategory_name = "default"
-                                        normalized_opt_methods[category_name] = {
-                                            subcategory_name: category_data
-                                        }
-                                else:
-                                    # Empty methods or not a list, wrap in default subcategory
-                                    normalized_opt_methods[category_name] = {
-                                        "default": category_data
-                                    }
-                            else:
-                                # Already has subcategories, just rename if needed
-                                normalized_opt_methods[category_name] = category_data
-                        
-                        # Update the optimization_methods with normalized structure
-                        value["optimization_methods"] = normalized_opt_methods
-                    
-                    # Recursively process the rest of the model data
-                    normalized[key] = {k: self._normalize_category_names(v) if isinstance(v, dict) else v 
-                                      for k, v in value.items()}
+        # Walk every nested dict once; only optimization_methods dicts are replaced
+        stack = [taxonomy]
+        while stack:
+            node = stack.pop()
+            for key, value in node.items():
+                if key == "relationships" or not isinstance(value, dict):
+                    # Preserve relationships and leaf values as-is
+                    continue
+                opt_methods = value.get("optimization_methods")
+                if isinstance(opt_methods, dict):
+                    value["optimization_methods"] = self._normalize_optimization_methods(opt_methods)
+                stack.append(value)
+        
+        return taxonomy
+
+    @staticmethod
+    def _normalize_optimization_methods(opt_methods: Dict[str, Any]) -> Dict[str, Any]:
+        """Rename legacy categories and wrap flat categories in a subcategory."""
+        normalized_opt_methods = {}
+        for category_name, category_data in opt_methods.items():
+            # Rename legacy categories (weight_quantization -> quantization)
+            category_name = _CATEGORY_RENAMES.get(category_name, category_name)
+            
+            # Check if category_data has "methods" directly (flat structure)
+            if isinstance(category_data, dict) and "methods" in category_data:
+                methods = category_data["methods"]
+                if isinstance(methods, list) and methods and isinstance(methods[0], str):
+                    # Flat list of method names: use the category's default subcategory
+                    subcategory_name = _DEFAULT_SUBCATEGORIES.get(category_name, "default")
                 else:
-                    # Recursively process nested dictionaries
-                    normalized[key] = self._normalize_category_names(value)
+                    # Method objects or an empty/non-list value: wrap in "default"
+                    subcategory_name = "default"
+                normalized_opt_methods[category_name] = {subcategory_name: category_data}
             else:
-                normalized[key] = value
+                # Already has subcategories, just rename if needed
+                normalized_opt_methods[category_name] = category_data
         
-        return normalized
+        return normalized_opt_methods
@@ -1,9 +1,24 @@
 from __future__ import annotations
 
+import re
 import warnings
 from typing import Any, Dict, List, Optional
 from federated_api.schema import CALIBRATION_FREE_SCHEMA
 
+# Allowed values, built once instead of per call. Tuples rather than frozensets:
+# membership over a handful of items is just as cheap, and an unhashable value
+# (e.g. a list) still gets the usual ValueError instead of a TypeError
+_VALID_CATEGORIES = ('quantization', 'fusion', 'pruning', 'structural', 'decomposition')
+_VALID_EFFECTIVENESS = ('high', 'medium', 'low')
+_VALID_ACCURACY_IMPACT = ('zero', 'minimal', 'moderate')
+_PERFORMANCE_NUMBER_FIELDS = ('latency_speedup', 'compression_ratio', 'accuracy_retention')
+
+# Sentinel for optional method fields where an explicit None is still invalid
+_MISSING = object()
+
+# At least three '/'-separated parts, each with a non-whitespace character
+_VALID_PATH_RE = re.compile(r'\s*[^/\s][^/]*(?:/\s*[^/\s][^/]*){2,}')
+
 
 class ValidationService:
     def validate_schema_structure(self, taxonomy: Dict[str, Any]) -> None:
@@ -23,6 +38,10 @@ class ValidationService:
             for rel in relationships:
                 self.validate_relationship(rel, taxonomy, skip_path_check=True)  # Skip path check for flexibility
         
+        # Bound once here rather than looked up per category in the nested loops
+        validate_category_name = self.validate_category_name
+        validate_subcategory = self._validate_subcategory
+        
         # Validate top-level structure (model_family -> subcategory -> specific_model)
         # Skip 'relationships' as it's a top-level optional field
         for model_family, subcategories in taxonomy.items():
@@ -53,48 +72,77 @@ class ValidationService:
                     if not isinstance(opt_methods, dict):
                         raise ValueError(f"optimization_methods must be a dictionary")
                     
-                    # Validate categories
-                    valid_categories = ['quantization', 'fusion', 'pruning', 'structural', 'decomposition']
-                    for category in opt_methods.keys():
-                        if category not in valid_categories:
-                            raise ValueError(f"Invalid category '{category}'. Must be one of {valid_categories}")
-                    
-                    # Validate methods in each category
+                    # Validate each category name and the methods under it in one pass
                     for category, subcategories_dict in opt_methods.items():
+                        validate_category_name(category)
                         if not isinstance(subcategories_dict, dict):
                             raise ValueError(f"Category '{category}' must contain a dictionary of subcategories")
                         
                         for subcat_name, subcat_data in subcategories_dict.items():
-                            if not isinstance(subcat_data, dict):
-                                raise ValueError(f"Subcategory '{subcat_name}' in '{category}' must be a dictionary")
-                            
-                            if 'methods' not in subcat_data:
-                                raise ValueError(f"Subcategory '{subcat_name}' in '{category}' must have a 'methods' key")
-                            
-                            methods = subcat_data['methods']
-                            if not isinstance(methods, list):
-                                raise ValueError(f"'methods' in '{category}/{subcat_name}' must be a list")
-                            
-                            # Validate each method (skip if methods are strings, as in base_tree.json)
-                            for i, method in enumerate(methods):
-                                # If method is a string, skip detailed validation (legacy format)
-                                if isinstance(method, str):
-                                    continue
-                                # Otherwise, validate as a full method object
-                                self.validate_optimization_method(method, f"{category}/{subcat_name}/methods[{i}]")
+                            validate_subcategory(category, subcat_name, subcat_data)
+
+    def validate_subtree(self, model_data: Dict[str, Any], category: str, subcategory: str) -> None:
+        """Validate only the optimization_methods[category][subcategory] slot of a model.
+        
+        Used after a single-method mutation instead of re-walking the whole taxonomy;
+        applies the same checks validate_schema_structure runs for that slot.
+        """
+        opt_methods = model_data.get('optimization_methods')
+        if not isinstance(opt_methods, dict):
+            raise ValueError(f"optimization_methods must be a dictionary")
+        
+        self.validate_category_name(category)
+        
+        subcategories_dict = opt_methods.get(category)
+        if not isinstance(subcategories_dict, dict):
+            raise ValueError(f"Category '{category}' must contain a dictionary of subcategories")
+        
+        if subcategory in subcategories_dict:
+            self._validate_subcategory(category, subcategory, subcategories_dict[subcategory])
+
+    def validate_category_name(self, category: str) -> None:
+        """Validate that category is one of the optimization method categories."""
+        if category not in _VALID_CATEGORIES:
+            raise ValueError(f"Invalid category '{category}'. Must be one of {list(_VALID_CATEGORIES)}")
+
+    def _validate_subcategory(self, category: str, subcat_name: str, subcat_data: Any) -> None:
+        if not isinstance(subcat_data, dict):
+            raise ValueError(f"Subcategory '{subcat_name}' in '{category}' must be a dictionary")
+        
+        if 'methods' not in subcat_data:
+            raise ValueError(f"Subcategory '{subcat_name}' in '{category}' must have a 'methods' key")
+        
+        methods = subcat_data['methods']
+        if not isinstance(methods, list):
+            raise ValueError(f"'methods' in '{category}/{subcat_name}' must be a list")
+        
+        # Validate each method (skip if methods are strings, as in base_tree.json);
+        # the bound method and context prefix are loop-invariant
+        validate_method = self.validate_optimization_method
+        context_prefix = f"{category}/{subcat_name}/methods"
+        for i, method in enumerate(methods):
+            # If method is a string, skip detailed validation (legacy format)
+            if isinstance(method, str):
+                continue
+            # Otherwise, validate as a full method object
+            validate_method(method, f"{context_prefix}[{i}]")
 
     def validate_path(self, path: str) -> None:
         """Validate path format (model_family/subcategory/specific_model or deeper)."""
         if not path or not isinstance(path, str):
             raise ValueError("Path must be a non-empty string")
         
+        # Well-formed paths (the normal case) pass with one regex scan
+        if _VALID_PATH_RE.fullmatch(path):
+            return
+        
         parts = path.split('/')
         if len(parts) < 3:
             raise ValueError("Path must have at least 3 parts: model_family/subcategory/specific_model")
         
         # Path parts should not be empty
         for part in parts:
-            if not part.strip():
+            if not part or part.isspace():
                 raise ValueError("Path parts cannot be empty")
 
     def validate_optimization_method(self, method: Dict[str, Any], context: str = "") -> None:
@@ -106,16 +154,13 @@ class ValidationService:
         if not isinstance(method, dict):
             raise ValueError(f"Method must be a dictionary{(' at ' + context) if context else ''}")
         
-        # Detect old format
+        # Detect old format (a missing key reads as None, which fails these checks
+        # just like the value being empty or of the wrong type)
         is_old_format = (
-            'techniques' not in method or
             not method.get('techniques') or
-            'performance' not in method or
             not isinstance(method.get('performance'), dict) or
-            'validation' not in method or
             not isinstance(method.get('validation'), dict) or
             isinstance(method.get('architecture'), str) or
-            'paper' not in method or
             not isinstance(method.get('paper'), dict)
         )
         
@@ -131,103 +176,103 @@ class ValidationService:
         if 'name' not in method:
             raise ValueError(f"Method missing required field 'name'{(' at ' + context) if context else ''}")
         
-        if not isinstance(method['name'], str) or not method['name'].strip():
+        name = method['name']
+        if not isinstance(name, str) or not name or name.isspace():
             raise ValueError(f"Method 'name' must be a non-empty string{(' at ' + context) if context else ''}")
         
+        # Each optional field is read once: fields where None means "not set" use
+        # .get(), the rest use _MISSING so an explicit None is still rejected
         # Validate effectiveness if present
-        if 'effectiveness' in method:
-            valid_effectiveness = ['high', 'medium', 'low']
-            if method['effectiveness'] not in valid_effectiveness:
-                raise ValueError(f"Method 'effectiveness' must be one of {valid_effectiveness}{(' at ' + context) if context else ''}")
+        effectiveness = method.get('effectiveness', _MISSING)
+        if effectiveness is not _MISSING and effectiveness not in _VALID_EFFECTIVENESS:
+            raise ValueError(f"Method 'effectiveness' must be one of {list(_VALID_EFFECTIVENESS)}{(' at ' + context) if context else ''}")
         
         # Validate accuracy_impact if present
-        if 'accuracy_impact' in method:
-            valid_accuracy_impact = ['zero', 'minimal', 'moderate']
-            if method['accuracy_impact'] not in valid_accuracy_impact:
-                raise ValueError(f"Method 'accuracy_impact' must be one of {valid_accuracy_impact}{(' at ' + context) if context else ''}")
+        accuracy_impact = method.get('accuracy_impact', _MISSING)
+        if accuracy_impact is not _MISSING and accuracy_impact not in _VALID_ACCURACY_IMPACT:
+            raise ValueError(f"Method 'accuracy_impact' must be one of {list(_VALID_ACCURACY_IMPACT)}{(' at ' + context) if context else ''}")
         
         # Validate new ideal structure fields if present
-        if 'techniques' in method:
-            if not isinstance(method['techniques'], list):
-                raise ValueError(f"Method 'techniques' must be a list{(' at ' + context) if context else ''}")
+        techniques = method.get('techniques', _MISSING)
+        if techniques is not _MISSING and not isinstance(techniques, list):
+            raise ValueError(f"Method 'techniques' must be a list{(' at ' + context) if context else ''}")
         
-        if 'performance' in method:
-            if not isinstance(method['performance'], dict):
+        perf = method.get('performance', _MISSING)
+        if perf is not _MISSING:
+            if not isinstance(perf, dict):
                 raise ValueError(f"Method 'performance' must be a dictionary{(' at ' + context) if context else ''}")
             # Validate performance fields
-            perf = method['performance']
-            for key in ['latency_speedup', 'compression_ratio', 'accuracy_retention']:
+            for key in _PERFORMANCE_NUMBER_FIELDS:
                 if key in perf and not isinstance(perf[key], (int, float)):
                     raise ValueError(f"Method 'performance.{key}' must be a number{(' at ' + context) if context else ''}")
         
-        if 'validation' in method:
-            if not isinstance(method['validation'], dict):
+        val = method.get('validation', _MISSING)
+        if val is not _MISSING:
+            if not isinstance(val, dict):
                 raise ValueError(f"Method 'validation' must be a dictionary{(' at ' + context) if context else ''}")
             # Validate validation fields
-            val = method['validation']
             if 'confidence' in val and not isinstance(val['confidence'], (int, float)):
                 raise ValueError(f"Method 'validation.confidence' must be a number{(' at ' + context) if context else ''}")
             if 'sample_count' in val and not isinstance(val['sample_count'], int):
                 raise ValueError(f"Method 'validation.sample_count' must be an integer{(' at ' + context) if context else ''}")
         
-        if 'architecture' in method:
+        arch = method.get('architecture', _MISSING)
+        if arch is not _MISSING:
             # Architecture can be string (legacy) or dict (new)
-            arch = method['architecture']
             if not isinstance(arch, (str, dict)):
                 raise ValueError(f"Method 'architecture' must be a string or dictionary{(' at ' + context) if context else ''}")
             if isinstance(arch, dict):
                 if 'family' not in arch or 'variant' not in arch:
                     raise ValueError(f"Method 'architecture' dict must have 'family' and 'variant' keys{(' at ' + context) if context else ''}")
         
-        if 'paper' in method:
-            if not isinstance(method['paper'], dict):
-                raise ValueError(f"Method 'paper' must be a dictionary{(' at ' + context) if context else ''}")
+        paper = method.get('paper', _MISSING)
+        if paper is not _MISSING and not isinstance(paper, dict):
+            raise ValueError(f"Method 'paper' must be a dictionary{(' at ' + context) if context else ''}")
         
         # Validate legacy optional fields
-        if 'bit_widths' in method:
-            if not isinstance(method['bit_widths'], list):
-                raise ValueError(f"Method 'bit_widths' must be a list{(' at ' + context) if context else ''}")
+        bit_widths = method.get('bit_widths', _MISSING)
+        if bit_widths is not _MISSING and not isinstance(bit_widths, list):
+            raise ValueError(f"Method 'bit_widths' must be a list{(' at ' + context) if context else ''}")
         
-        if 'granularity' in method and method['granularity'] is not None:
-            if not isinstance(method['granularity'], str):
-                raise ValueError(f"Method 'granularity' must be a string or None{(' at ' + context) if context else ''}")
+        granularity = method.get('granularity')
+        if granularity is not None and not isinstance(granularity, str):
+            raise ValueError(f"Method 'granularity' must be a string or None{(' at ' + context) if context else ''}")
         
-        if 'compression_ratio' in method and method['compression_ratio'] is not None:
-            if not isinstance(method['compression_ratio'], (str, int, float)):
-                raise ValueError(f"Method 'compression_ratio' must be a string or number{(' at ' + context) if context else ''}")
+        compression_ratio = method.get('compression_ratio')
+        if compression_ratio is not None and not isinstance(compression_ratio, (str, int, float)):
+            raise ValueError(f"Method 'compression_ratio' must be a string or number{(' at ' + context) if context else ''}")
         
-        if 'speedup' in method and method['speedup'] is not None:
-            if not isinstance(method['speedup'], (str, int, float)):
-                raise ValueError(f"Method 'speedup' must be a string or number{(' at ' + context) if context else ''}")
+        speedup = method.get('speedup')
+        if speedup is not None and not isinstance(speedup, (str, int, float)):
+            raise ValueError(f"Method 'speedup' must be a string or number{(' at ' + context) if context else ''}")
         
-        if 'notes' in method:
-            if not isinstance(method['notes'], str):
-                raise ValueError(f"Method 'notes' must be a string{(' at ' + context) if context else ''}")
+        notes = method.get('notes', _MISSING)
+        if notes is not _MISSING and not isinstance(notes, str):
+            raise ValueError(f"Method 'notes' must be a string{(' at ' + context) if context else ''}")
         
         # Validate paper fields if present (legacy format)
-        if 'paper_title' in method and method['paper_title'] is not None:
-            if not isinstance(method['paper_title'], str):
-                raise ValueError(f"Method 'paper_title' must be a string{(' at ' + context) if context else ''}")
+        paper_title = method.get('paper_title')
+        if paper_title is not None and not isinstance(paper_title, str):
+            raise ValueError(f"Method 'paper_title' must be a string{(' at ' + context) if context else ''}")
         
-        if 'paper_link' in method and method['paper_link'] is not None:
-            if not isinstance(method['paper_link'], str):
-                raise ValueError(f"Method 'paper_link' must be a string{(' at ' + context) if context else ''}")
+        paper_link = method.get('paper_link')
+        if paper_link is not None and not isinstance(paper_link, str):
+            raise ValueError(f"Method 'paper_link' must be a string{(' at ' + context) if context else ''}")
         
-        if 'venue' in method and method['venue'] is not None:
-            if not isinstance(method['venue'], str):
-                raise ValueError(f"Method 'venue' must be a string{(' at ' + context) if context else ''}")
+        venue = method.get('venue')
+        if venue is not None and not isinstance(venue, str):
+            raise ValueError(f"Method 'venue' must be a string{(' at ' + context) if context else ''}")
         
-        if 'year' in method and method['year'] is not None:
-            if not isinstance(method['year'], int) or method['year'] < 1900 or method['year'] > 2100:
-                raise ValueError(f"Method 'year' must be an integer between 1900 and 2100{(' at ' + context) if context else ''}")
+        year = method.get('year')
+        if year is not None and not (isinstance(year, int) and 1900 <= year <= 2100):
+            raise ValueError(f"Method 'year' must be an integer between 1900 and 2100{(' at ' + context) if context else ''}")
         
-        if 'authors' in method and method['authors'] is not None:
-            if not isinstance(method['authors'], (str, list)):
-                raise ValueError(f"Method 'authors' must be a string or list{(' at ' + context) if context else ''}")
+        authors = method.get('authors')
+        if authors is not None and not isinstance(authors, (str, list)):
+            raise ValueError(f"Method 'authors' must be a string or list{(' at ' + context) if context else ''}")
 
-    def validate_method_data(self, method_data: Dict[str, Any]) -> None:
-        """Validate method data matches standardized structure."""
-        self.validate_optimization_method(method_data)
+    # Validate method data matches standardized structure (same check, no extra frame)
+    validate_method_data = validate_optimization_method
 
     def validate_relationship(
         self, 
@@ -256,7 +301,7 @@ class ValidationService:
                 if not isinstance(method_path, str):
                     raise ValueError(f"Method path must be a string: {method_path}")
                 # Validate path format (basic check)
-                if not method_path.strip():
+                if not method_path or method_path.isspace():
                     raise ValueError("Method path cannot be empty")
         
         # Validate weights structure (optional)
@@ -309,3 +354,7 @@ class ValidationService:
             if 'tested_datasets' in metadata:
                 if not isinstance(metadata['tested_datasets'], list):
                     raise ValueError("Relationship 'metadata.tested_datasets' must be a list")
+
+
+# Shared instance; ValidationService holds no per-caller state
+default_validation_service = ValidationService()
@@ -0,0 +1,92 @@
+"""Tests for the in-memory tree repository."""
+
+import pytest
+from federated_api.database import TreeNotFoundError, TreeRepository
+
+
+@pytest.fixture
+def repo():
+    return TreeRepository()
+
+
+class TestMutate:
+    """Test read-modify-write through TreeRepository.mutate."""
+
+    def test_passes_result_through(self, repo):
+        """Test that fn edits the stored tree and its result is returned."""
+        tree_id = repo.create({"a": 1})
+
+        def apply(tree):
+            tree["b"] = 2
+            return "done"
+
+        assert repo.mutate(tree_id, apply) == "done"
+        assert repo.get(tree_id) == {"a": 1, "b": 2}
+
+    def test_missing_tree(self, repo):
+        """Test that an unknown tree raises TreeNotFoundError without calling fn."""
+        calls = []
+        with pytest.raises(TreeNotFoundError):
+            repo.mutate("missing", calls.append)
+        assert calls == []
+        assert repo.revision("missing") == 0
+
+    def test_bumps_revision(self, repo):
+        """Test that every mutate counts as a write."""
+        tree_id = repo.create({})
+        before = repo.revision(tree_id)
+        repo.mutate(tree_id, lambda tree: None)
+        assert repo.revision(tree_id) > before
+
+    def test_bumps_revision_when_fn_raises(self, repo):
+        """Test that a failing fn still counts as a write, since it may have edited the tree."""
+        tree_id = repo.create({})
+        before = repo.revision(tree_id)
+
+        def apply(tree):
+            tree["partial"] = True
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError, match="boom"):
+            repo.mutate(tree_id, apply)
+        assert repo.revision(tree_id) > before
+
+
+class TestRevision:
+    """Test revision tracking."""
+
+    def test_upsert_and_upsert_many_bump_revision(self, repo):
+        """Test that every stored tree gets a new revision."""
+        repo.upsert("a", {})
+        first = repo.revision("a")
+        repo.upsert_many([("a", {"x": 1}), ("b", {})])
+        assert repo.revision("a") > first
+        assert repo.revision("b") > 0
+        assert repo.get("a") == {"x": 1}
+
+    def test_delete_resets_revision(self, repo):
+        """Test that a deleted tree reports revision 0."""
+        tree_id = repo.create({})
+        assert repo.delete(tree_id) is True
+        assert repo.revision(tree_id) == 0
+        assert repo.delete(tree_id) is False
+
+
+class TestGetSubtree:
+    """Test subtree lookups."""
+
+    def test_existing_path(self, repo):
+        """Test that the value at the path is returned."""
+        tree_id = repo.create({"family": {"sub": {"model": {"x": 1}}}})
+        assert repo.get_subtree(tree_id, ("family", "sub", "model")) == {"x": 1}
+
+    @pytest.mark.parametrize("parts", [("missing",), ("family", "missing"), ("family", "leaf", "deeper")])
+    def test_missing_path_returns_none(self, repo, parts):
+        """Test that a missing key or a walk through a non-dict value returns None."""
+        tree_id = repo.create({"family": {"leaf": "value"}})
+        assert repo.get_subtree(tree_id, parts) is None
+
+    def test_missing_tree(self, repo):
+        """Test that an unknown tree raises TreeNotFoundError."""
+        with pytest.raises(TreeNotFoundError):
+            repo.get_subtree("missing", ("family",))
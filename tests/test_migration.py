@@ -301,3 +301,31 @@ class TestArchitectureMigration:
         assert migrated["architecture"]["variant"] == "ResNet"
         assert migrated["architecture_family"] == "CNN"  # Preserved for backward compatibility
 
+
+class TestPaperMigration:
+    """Test paper field migration."""
+    
+    def test_migrate_paper_title_from_source_refs(self):
+        """Test that the first source paper ref is used as title."""
+        node = {
+            "name": "Test",
+            "source": {"paper_refs": ["Ref Paper"]},
+            "paper_title": "Legacy Title"
+        }
+        
+        migrated = migrate_node_to_ideal_schema(node)
+        
+        assert migrated["paper"]["title"] == "Ref Paper"
+    
+    def test_migrate_paper_title_fallback(self):
+        """Test falling back to paper_title when there are no source refs."""
+        node = {
+            "name": "Test",
+            "paper_title": "Legacy Title",
+            "authors": "A. One, , B. Two "
+        }
+        
+        migrated = migrate_node_to_ideal_schema(node)
+        
+        assert migrated["paper"]["title"] == "Legacy Title"
+        assert migrated["paper"]["authors"] == ["A. One", "B. Two"]
@@ -0,0 +1,97 @@
+import os
+
+import pytest
+from fastapi.testclient import TestClient
+from federated_api.database import tree_repository
+from federated_api.main import create_app
+
+MODEL_PATH = "cnn_based_models/classification/resnet"
+API_KEY = os.getenv("FEDERATED_API_KEY")
+HEADERS = {"Authorization": f"Bearer {API_KEY}"} if API_KEY else {}
+
+
+def make_method(name):
+    return {
+        "name": name,
+        "techniques": ["fuse_layers"],
+        "performance": {"latency_speedup": 2.0, "compression_ratio": 1.0, "accuracy_retention": 1.0},
+        "validation": {"confidence": 0.8, "sample_count": 10},
+        "architecture": {"family": "CNN", "variant": "ResNet"},
+        "paper": {"title": "Test Paper"},
+    }
+
+
+@pytest.fixture
+def client():
+    return TestClient(create_app())
+
+
+@pytest.fixture
+def tree_id():
+    tree_id = tree_repository.create({})
+    yield tree_id
+    tree_repository.delete(tree_id)
+
+
+def stored_methods(tree_id):
+    model = tree_repository.get_subtree(tree_id, MODEL_PATH.split("/"))
+    if model is None:
+        return []
+    return model["optimization_methods"]["fusion"]["layer_fusion"]["methods"]
+
+
+def test_add_methods_batch(client, tree_id):
+    payload = {
+        "path": MODEL_PATH,
+        "category": "fusion",
+        "subcategory": "layer_fusion",
+        "methods": [make_method("Conv-BN Fusion"), make_method("Layer Fusion")],
+    }
+    r = client.post(f"/api/v1/trees/{tree_id}/methods/batch", json=payload, headers=HEADERS)
+    assert r.status_code == 200
+    assert r.json() == {"status": "added", "count": 2}
+    assert [m["name"] for m in stored_methods(tree_id)] == ["Conv-BN Fusion", "Layer Fusion"]
+
+
+@pytest.mark.parametrize(
+    "missing, detail",
+    [
+        ("path", "'path' is required"),
+        ("category", "'category' is required"),
+        ("subcategory", "'subcategory' is required"),
+        ("methods", "'methods' must be a non-empty list"),
+    ],
+)
+def test_add_methods_batch_payload_errors(client, tree_id, missing, detail):
+    payload = {
+        "path": MODEL_PATH,
+        "category": "fusion",
+        "subcategory": "layer_fusion",
+        "methods": [make_method("Conv-BN Fusion")],
+    }
+    del payload[missing]
+    r = client.post(f"/api/v1/trees/{tree_id}/methods/batch", json=payload, headers=HEADERS)
+    assert r.status_code == 400
+    assert detail in r.json()["detail"]
+
+
+def test_add_methods_batch_empty_methods(client, tree_id):
+    payload = {"path": MODEL_PATH, "category": "fusion", "subcategory": "layer_fusion", "methods": []}
+    r = client.post(f"/api/v1/trees/{tree_id}/methods/batch", json=payload, headers=HEADERS)
+    assert r.status_code == 400
+    assert "'methods' must be a non-empty list" in r.json()["detail"]
+
+
+def test_add_methods_batch_invalid_method_rejects_batch(client, tree_id):
+    invalid = make_method("Broken Method")
+    del invalid["name"]
+    payload = {
+        "path": MODEL_PATH,
+        "category": "fusion",
+        "subcategory": "layer_fusion",
+        "methods": [make_method("Conv-BN Fusion"), invalid],
+    }
+    r = client.post(f"/api/v1/trees/{tree_id}/methods/batch", json=payload, headers=HEADERS)
+    assert r.status_code == 400
+    assert "missing required field 'name'" in r.json()["detail"]
+    assert tree_repository.get(tree_id) == {}
@@ -0,0 +1,219 @@
+"""Tests for tree service."""
+
+import pytest
+from federated_api.database import tree_repository
+from federated_api.services.tree_service import TreeService
+
+MODEL_PATH = "cnn_based_models/classification/resnet"
+
+
+def make_method(name="Conv-BN Fusion", **overrides):
+    """Build a method in the ideal schema format."""
+    method = {
+        "name": name,
+        "techniques": ["fuse_layers"],
+        "performance": {"latency_speedup": 2.0, "compression_ratio": 1.0, "accuracy_retention": 1.0},
+        "validation": {"confidence": 0.8, "sample_count": 10},
+        "architecture": {"family": "CNN", "variant": "ResNet"},
+        "paper": {"title": "Test Paper"},
+        "effectiveness": "high",
+    }
+    method.update(overrides)
+    return method
+
+
+@pytest.fixture
+def service():
+    return TreeService()
+
+
+@pytest.fixture
+def tree_id():
+    """A stored taxonomy with one fusion method under MODEL_PATH."""
+    taxonomy = {
+        "cnn_based_models": {
+            "classification": {
+                "resnet": {
+                    "optimization_methods": {
+                        "fusion": {"layer_fusion": {"methods": [make_method()]}}
+                    }
+                }
+            }
+        }
+    }
+    tree_id = tree_repository.create(taxonomy)
+    yield tree_id
+    tree_repository.delete(tree_id)
+
+
+class TestMethodMutations:
+    """Test that rejected method mutations leave the stored tree untouched."""
+
+    def test_add_invalid_category_not_stored(self, service, tree_id):
+        """Test that an invalid category is rejected before the tree is edited."""
+        with pytest.raises(ValueError, match="Invalid category"):
+            service.add_optimization_method(tree_id, MODEL_PATH, "bogus", "sub", make_method())
+
+        opt_methods = service.get_path(tree_id, MODEL_PATH)["optimization_methods"]
+        assert "bogus" not in opt_methods
+
+        # Later mutations on the same tree still work
+        service.add_optimization_method(tree_id, MODEL_PATH, "fusion", "layer_fusion", make_method("Layer Fusion"))
+        assert len(opt_methods["fusion"]["layer_fusion"]["methods"]) == 2
+
+    def test_update_invalid_method_not_stored(self, service, tree_id):
+        """Test that an invalid update is rejected before the method is edited."""
+        with pytest.raises(ValueError, match="effectiveness"):
+            service.update_optimization_method(
+                tree_id, MODEL_PATH, "fusion", "layer_fusion", 0, {"effectiveness": "bogus"}
+            )
+
+        methods = service.get_optimization_methods(tree_id, MODEL_PATH)
+        assert methods[0]["effectiveness"] == "high"
+
+
+class TestMalformedSlots:
+    """Test that non-dict values along a method slot are reported, not raised as TypeError."""
+
+    @pytest.fixture
+    def malformed_tree_id(self):
+        taxonomy = {
+            "cnn_based_models": {
+                "classification": {
+                    "leaf": "not a model",
+                    "resnet": {"optimization_methods": {"fusion": "not a dict", "pruning": {"structured": []}}},
+                }
+            }
+        }
+        tree_id = tree_repository.create(taxonomy)
+        yield tree_id
+        tree_repository.delete(tree_id)
+
+    @pytest.mark.parametrize(
+        "path, category, subcategory",
+        [
+            ("cnn_based_models/classification/leaf", "fusion", "layer_fusion"),
+            (MODEL_PATH, "fusion", "layer_fusion"),
+            (MODEL_PATH, "pruning", "structured"),
+        ],
+    )
+    def test_remove_returns_false(self, service, malformed_tree_id, path, category, subcategory):
+        """Test that removing from a malformed slot returns False."""
+        assert service.remove_optimization_method(malformed_tree_id, path, category, subcategory, 0) is False
+
+    @pytest.mark.parametrize(
+        "path, category, subcategory",
+        [
+            ("cnn_based_models/classification/leaf", "fusion", "layer_fusion"),
+            (MODEL_PATH, "fusion", "layer_fusion"),
+            (MODEL_PATH, "pruning", "structured"),
+        ],
+    )
+    def test_update_raises_value_error(self, service, malformed_tree_id, path, category, subcategory):
+        """Test that updating a malformed slot raises ValueError."""
+        with pytest.raises(ValueError):
+            service.update_optimization_method(malformed_tree_id, path, category, subcategory, 0, {"name": "x"})
+
+
+class TestBulkLoad:
+    """Test loading several taxonomy files at once."""
+
+    def test_loads_all_files(self, service, tmp_path):
+        """Test that every file is stored when all of them load."""
+        first = tmp_path / "first.json"
+        second = tmp_path / "second.json"
+        first.write_text("{}")
+        second.write_text('{"relationships": []}')
+
+        results = service.bulk_load_from_files([("bulk-1", str(first)), ("bulk-2", str(second))])
+        try:
+            assert results == [
+                {"status": "success", "tree_id": "bulk-1"},
+                {"status": "success", "tree_id": "bulk-2"},
+            ]
+            assert tree_repository.get("bulk-1") == {}
+            assert tree_repository.get("bulk-2") == {"relationships": []}
+        finally:
+            tree_repository.delete("bulk-1")
+            tree_repository.delete("bulk-2")
+
+    @pytest.mark.parametrize(
+        "content, error",
+        [
+            (None, FileNotFoundError),
+            ("{not json", ValueError),
+            ('{"relationships": "not a list"}', ValueError),
+        ],
+    )
+    def test_one_bad_file_stores_nothing(self, service, tmp_path, content, error):
+        """Test that a single failing file leaves every tree untouched."""
+        good = tmp_path / "good.json"
+        good.write_text("{}")
+        bad = tmp_path / "bad.json"
+        if content is not None:
+            bad.write_text(content)
+        tree_repository.upsert("bulk-existing", {"keep": {}})
+        revision = tree_repository.revision("bulk-existing")
+
+        try:
+            with pytest.raises(error):
+                service.bulk_load_from_files([("bulk-existing", str(good)), ("bulk-new", str(bad))])
+            assert tree_repository.get("bulk-existing") == {"keep": {}}
+            assert tree_repository.revision("bulk-existing") == revision
+            assert not tree_repository.exists("bulk-new")
+        finally:
+            tree_repository.delete("bulk-existing")
+
+
+class TestRelationshipIndex:
+    """Test the cached relationship id index."""
+
+    def test_write_between_revision_and_read(self, service, tree_id, monkeypatch):
+        """Test that a write landing while the index is built does not leave it stale."""
+        tree_repository.upsert(tree_id, {"relationships": [{"id": "rel", "methods": ["OLD"]}]})
+        new_tree = {"relationships": [{"id": "rel", "methods": ["NEW"]}]}
+        original_get = tree_repository.get
+
+        def get_then_write(requested_id):
+            tree = original_get(requested_id)
+            monkeypatch.setattr(tree_repository, "get", original_get)
+            tree_repository.upsert(requested_id, new_tree)
+            return tree
+
+        monkeypatch.setattr(tree_repository, "get", get_then_write)
+        assert service.get_relationship(tree_id, "rel")["methods"] == ["OLD"]
+        assert service.get_relationship(tree_id, "rel")["methods"] == ["NEW"]
+
+    def test_evicted_on_delete(self, service):
+        """Test that deleting a tree drops its cached index."""
+        from federated_api.services import tree_service
+
+        tree_id = tree_repository.create({"relationships": [{"id": "rel", "methods": []}]})
+        assert service.get_relationship(tree_id, "rel") is not None
+        assert tree_id in tree_service._relationship_indices
+
+        tree_repository.delete(tree_id)
+        assert tree_id not in tree_service._relationship_indices
+
+    def test_remove_unknown_id_does_not_write(self, service, tree_id):
+        """Test that removing an unknown relationship id leaves the tree unwritten."""
+        revision = tree_repository.revision(tree_id)
+        assert service.remove_relationship(tree_id, "missing") is False
+        assert tree_repository.revision(tree_id) == revision
+
+    def test_remove_after_remove(self, service):
+        """Test that consecutive removes see the index rebuilt after each write."""
+        tree_id = tree_repository.create({
+            "relationships": [
+                {"id": "a", "methods": []},
+                {"id": "b", "methods": []},
+                {"id": "a", "methods": []},
+            ]
+        })
+        try:
+            assert service.remove_relationship(tree_id, "a") is True
+            assert service.remove_relationship(tree_id, "a") is False
+            assert service.remove_relationship(tree_id, "b") is True
+            assert service.get_relationships(tree_id) == []
+        finally:
+            tree_repository.delete(tree_id)